@@ -1,81 +1,204 @@
+import asyncio
+import hashlib
+import html
+import logging
 import os
+import queue
+import threading
 import time
-from typing import List, Dict, Any
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dotenv import load_dotenv
 
 import streamlit as st
-from passlib.hash import bcrypt_sha256
-import spacy
+from passlib.context import CryptContext
 
-# Load spaCy model for NER (download 'en_core_web_sm' if not already installed)
-nlp = spacy.load("en_core_web_sm")
+# Heavy libraries (spaCy, google-genai) are imported on first use rather than at script
+# start, so the login page doesn't pay for them.
 
-import db
-from news_api import search_news, top_headlines
-from sentiment import analyze_sentiment
-from utils import estimate_read_time, CATEGORIES
+# Load spaCy model for NER (download 'en_core_web_sm' if not already installed).
+# Only tok2vec + ner are needed for doc.ents, so the rest of the pipeline is never loaded.
+@st.cache_resource
+def get_nlp():
+    import spacy
+    return spacy.load("en_core_web_sm", exclude=["tagger", "parser", "attribute_ruler", "lemmatizer"])
 
-# ---------- Gemini Integration ----------
-# from google import genai
-from google import genai
+import db
+from news_api import search_news, top_headlines, top_headlines_multi
+from sentiment import analyze_sentiments
+from utils import estimate_read_time, estimate_read_times, is_category, CATEGORIES
 
-from google.genai import types
+logger = logging.getLogger(__name__)
 
+# ---------- Gemini Integration ----------
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+
+# Ad- and script-heavy pages can push the story body well past the first few hundred KB
+MAX_ARTICLE_BYTES = 1024 * 1024
+# A description this long already carries the story; skip scraping the page
+SUBSTANTIVE_DESC_CHARS = 800
+
+# One pooled session per process: keep-alive connections to publishers are reused
+# across fetches instead of a new TCP+TLS handshake each time. Only connect/read errors
+# are retried; a publisher's Retry-After must not stall the script thread past the timeout.
+@st.cache_resource
+def _get_scrape_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update({'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
+    retry = Retry(total=2, status=0, backoff_factor=0.2, respect_retry_after_header=False)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 def fetch_full_article(url: str) -> str:
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        # Extract main article body; customize selector based on site (e.g., for Hindustan Times)
-        article_body = soup.select_one('div.storyDetail') or soup.select_one('article') or soup.find('div', class_='article-body')
-        if article_body:
-            # Remove scripts, styles, and ads for clean text
-            for elem in article_body.find_all(['script', 'style', 'aside', 'figure']):
-                elem.extract()
-            return article_body.get_text(strip=True)
-        return "Full article content not available."
+        return _download_article(url)
     except Exception as e:
         return f"Error fetching full article: {e}"
+
+# Cached by URL so follow-up questions on the same article skip the download + parse.
+# Failures raise and therefore aren't cached.
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _download_article(url: str) -> str:
+    # Read at most MAX_ARTICLE_BYTES so a huge page can't blow up download + parse time.
+    # The with-block releases the response either way; only a page cut off at the cap
+    # costs its pooled connection.
+    with _get_scrape_session().get(url, timeout=(3, 10), stream=True) as response:
+        response.raise_for_status()
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=16384):
+            body += chunk
+            if len(body) >= MAX_ARTICLE_BYTES:
+                break
+        page = bytes(body[:MAX_ARTICLE_BYTES]).decode(response.encoding or "utf-8", errors="replace")
+    # selectolax's C (lexbor) parser is much faster than building a BeautifulSoup tree
+    tree = LexborHTMLParser(page)
+    # Extract main article body; customize selector based on site (e.g., for Hindustan Times)
+    article_body = tree.css_first('div.storyDetail') or tree.css_first('article') or tree.css_first('div.article-body')
+    if article_body:
+        # Remove scripts, styles, and ads for clean text
+        for elem in article_body.css('script, style, aside, figure'):
+            elem.decompose()
+        return article_body.text(separator=' ', strip=True)
+    # No known container: fall back to the page body minus scripts and page chrome
+    if tree.body is not None:
+        for elem in tree.body.css('script, style, noscript, nav, header, footer, aside, figure'):
+            elem.decompose()
+        text = tree.body.text(separator=' ', strip=True)
+        if text:
+            return text
+    return "Full article content not available."
     
 
 load_dotenv()
 api_key = os.getenv("GEMINI_API_KEY")
 if not api_key:
     st.error("GEMINI_API_KEY not found in .env file!")
-client = genai.Client(api_key=api_key)
 
+# Streamlit re-executes this module on every rerun; cache the client so its pooled
+# keep-alive (HTTP/2) connections survive instead of paying a TLS handshake per call.
+@st.cache_resource
+def get_gemini_client():
+    import httpx
+    from google import genai
+    from google.genai import types
+
+    limits = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={"http2": True, "limits": limits},
+            async_client_args={"http2": True, "limits": limits},
+        ),
+    )
 
-# Example for summarize_text (apply similarly to other functions)
-def summarize_text(text: str) -> str:
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=f"Summarize the following text:\n{text}",
-        config=types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=0))
+
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# Built once and shared by every call (thinking disabled for low latency); the lazy
+# google-genai import keeps it off the login path.
+@lru_cache(maxsize=1)
+def gemini_fast_config():
+    from google.genai import types
+    return types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=0))
+
+# Identical prompts resolve from Streamlit's cache instead of another Gemini round-trip
+@st.cache_data(ttl=86400, max_entries=512, show_spinner=False)
+def _gemini_generate(prompt: str) -> str:
+    response = get_gemini_client().models.generate_content(
+        model=GEMINI_MODEL,
+        contents=prompt,
+        config=gemini_fast_config()
     )
     return response.text
 
+# Example for summarize_text (apply similarly to other functions)
+def summarize_text(text: str) -> str:
+    return _gemini_generate(f"Summarize the following text:\n{text}")
+
 def generate_questions(text: str) -> str:
-    response = client.models.generate_content(
-        model="gemini-2.5-flash",
-        contents=f"Generate 3 questions based on the following text:\n{text}",
-        config=types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=0))
+    return _gemini_generate(f"Generate 3 questions based on the following text:\n{text}")
+
+# ---------- Gemini Batch API (bulk summaries) ----------
+# One batch job replaces N synchronous generate_content calls; results arrive
+# asynchronously, so callers poll the job instead of blocking per article.
+_BATCH_DONE_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+def submit_batch(texts: List[str], client=None) -> str:
+    inline_requests = [
+        {"contents": [{"parts": [{"text": f"Summarize the following text:\n{t}"}], "role": "user"}]}
+        for t in texts
+    ]
+    job = (client or get_gemini_client()).batches.create(
+        model=GEMINI_MODEL,
+        src=inline_requests,
+        config={"display_name": "news-pulse-summaries"},
     )
-    return response.text
+    return job.name
+
+def get_batch_status(job_name: str, client=None) -> str:
+    return (client or get_gemini_client()).batches.get(name=job_name).state.name
+
+def retrieve_batch_results(job_name: str, client=None) -> List[str]:
+    job = (client or get_gemini_client()).batches.get(name=job_name)
+    return [(r.response.text if r.response else "") for r in job.dest.inlined_responses]
+
+def batch_summarize(texts: List[str], poll_interval: float = 10.0, timeout: float = 3600.0,
+                    client=None) -> List[str]:
+    """Summarize many texts with one Gemini batch job, blocking until it finishes.
+
+    Pass client when calling off the script thread (get_gemini_client needs its run context).
+    """
+    job_name = submit_batch(texts, client)
+    deadline = time.time() + timeout
+    state = get_batch_status(job_name, client)
+    while state not in _BATCH_DONE_STATES:
+        if time.time() > deadline:
+            raise TimeoutError(f"Batch job {job_name} did not finish in {timeout:.0f}s")
+        time.sleep(poll_interval)
+        state = get_batch_status(job_name, client)
+    if state != "JOB_STATE_SUCCEEDED":
+        raise RuntimeError(f"Batch job {job_name} ended in state {state}")
+    return retrieve_batch_results(job_name, client)
 
 def web_search(query: str, num_results: int = 5) -> str:
     """Helper to perform web search using Gemini's tool and return formatted results."""
     try:
         # Use Gemini's web_search tool (requires tool-enabled API key)
+        client = get_gemini_client()
         tool = client.tools.web_search
         response = client.models.generate_content(
-            model="gemini-2.5-flash",
+            model=GEMINI_MODEL,
             contents=f"Search for: {query}",
             tools=[tool],
-            config=types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=0))
+            config=gemini_fast_config()
         )
         # Extract search results (format: list of titles, URLs, snippets)
         results = []
@@ -90,64 +213,121 @@ def web_search(query: str, num_results: int = 5) -> str:
         return ""
 
 def ask_question(article: Dict[str, Any], question: str) -> str:
+    return "".join(ask_question_stream(article, question))
+
+# ---------- Async Gemini ----------
+# One event loop per process, running on a daemon thread, drives client.aio calls so
+# a request can be in flight while the script thread does other work.
+@st.cache_resource
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="gemini-aio").start()
+    return loop
+
+_STREAM_END = object()
+GEMINI_STREAM_TIMEOUT = 60
+
+async def _astream_into(client, config, prompt: str, out: "queue.Queue"):
+    """Push streamed chunk texts onto out, then _STREAM_END (or the exception raised).
+
+    Runs on the gemini-aio thread, which has no Streamlit run context, so the client and
+    config are resolved by the caller on the script thread.
+    """
+    try:
+        stream = await client.aio.models.generate_content_stream(
+            model=GEMINI_MODEL,
+            contents=prompt,
+            config=config
+        )
+        async for chunk in stream:
+            if chunk.text:
+                out.put(chunk.text)
+        out.put(_STREAM_END)
+    except Exception as e:
+        out.put(e)
+
+def ask_question_stream(article: Dict[str, Any], question: str) -> Iterator[str]:
+    """Yield the answer in chunks so the UI can render it as Gemini generates it."""
     url = article.get("url", "")
     title = article.get("title", "")
     desc = article.get("description", "") or ""
-    
-    # Step 1: Fetch full content
-    full_content = fetch_full_article(url) if url else title + "\n\n" + desc
-    context = full_content[:4000] + "..." if len(full_content) > 4000 else full_content
-    
-    # Step 2: Check if answer is directly in article
-    extraction_prompt = f"""Article Content: {context}
+
+    reasoned_prompt = f"""Article Info (title/desc): {title}\n{desc}
 
 Question: {question}
 
-Extract and return ONLY the direct answer from the article if it's explicitly mentioned or clearly inferable (e.g., full list if asked for team members). If no complete answer is found, respond exactly with: "NOT_FOUND".
+The article doesn't have a complete direct answer, but use the provided info (e.g., mentioned players, context like 'under pressure' or competition) combined with your general knowledge of the topic (e.g., official squads, recent form, series previews) to provide a concise, accurate response. Structure it helpfully (e.g., numbered list for teams, with notes). Do not ask for more info—reason and answer based on this."""
 
-Be concise—no explanations or additions."""
-    
+    client, config, loop = get_gemini_client(), gemini_fast_config(), _get_event_loop()
+    chunks: "queue.Queue" = queue.Queue()
+
+    def start_reasoned():
+        return asyncio.run_coroutine_threadsafe(_astream_into(client, config, reasoned_prompt, chunks), loop)
+
+    # The reasoned answer only needs title/desc. When the article must be scraped first,
+    # start it now so it runs during the fetch + extraction; NOT_FOUND questions then cost
+    # ~one RTT, not two. The price is a second (cancelled, partly billed) generation for
+    # answerable questions, so with a substantive description (no scrape, extraction
+    # likely to succeed) it is only started after extraction comes back NOT_FOUND.
+    needs_fetch = bool(url) and len(desc) < SUBSTANTIVE_DESC_CHARS
+    reasoned = start_reasoned() if needs_fetch else None
     try:
-        extraction_response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=extraction_prompt,
-            config=types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=0))
-        )
-        extracted = extraction_response.text.strip()
-        
-        if extracted != "NOT_FOUND" and len(extracted) > 10:  # Threshold for substantive content
-            return f"From the article: {extracted}"
-    except Exception as e:
-        st.warning(f"Extraction error: {e}")
-    
-    # Step 3: If not in article, use Gemini's knowledge + article info for reasoned answer
-    reasoned_prompt = f"""Article Info (title/desc): {title}\n{desc}
+        # Step 1: Fetch full content (unless the description is already substantive)
+        if needs_fetch:
+            full_content = fetch_full_article(url)
+        else:
+            full_content = title + "\n\n" + desc
+        context = full_content[:4000] + "..." if len(full_content) > 4000 else full_content
+
+        # Step 2: Check if answer is directly in article
+        extraction_prompt = f"""Article Content: {context}
 
 Question: {question}
 
-The article doesn't have a complete direct answer, but use the provided info (e.g., mentioned players, context like 'under pressure' or competition) combined with your general knowledge of the topic (e.g., official squads, recent form, series previews) to provide a concise, accurate response. Structure it helpfully (e.g., numbered list for teams, with notes). Do not ask for more info—reason and answer based on this."""
+Extract and return ONLY the direct answer from the article if it's explicitly mentioned or clearly inferable (e.g., full list if asked for team members). If no complete answer is found, respond exactly with: "NOT_FOUND".
 
-    try:
-        reasoned_response = client.models.generate_content(
-            model="gemini-2.5-flash",
-            contents=reasoned_prompt,
-            config=types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=0))
-        )
-        return reasoned_response.text
-    except Exception as e:
+Be concise—no explanations or additions."""
+
+        try:
+            extracted = _gemini_generate(extraction_prompt).strip()
+
+            if extracted != "NOT_FOUND" and len(extracted) > 10:  # Threshold for substantive content
+                yield f"From the article: {extracted}"
+                return
+        except Exception as e:
+            st.warning(f"Extraction error: {e}")
+
+        # Step 3: If not in article, use Gemini's knowledge + article info for reasoned answer
+        if reasoned is None:
+            reasoned = start_reasoned()
+        streamed = False
+        while True:
+            try:
+                item = chunks.get(timeout=GEMINI_STREAM_TIMEOUT)
+            except queue.Empty:
+                item = TimeoutError(f"no response from Gemini in {GEMINI_STREAM_TIMEOUT}s")
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                e = item
+                break
+            streamed = True
+            yield item
+
+        if streamed:
+            yield f"\n\n(Response interrupted: {e})"
+            return
         # Final fallback: Simple web search if needed
         try:
             search_query = f"{title} {question}"
             # Basic search simulation (replace with actual if you have API; for now, prompt Gemini for it)
             search_fallback_prompt = f"{reasoned_prompt}\nIf still unclear, briefly note sources like BCCI/ESPN."
-            fallback_response = client.models.generate_content(
-                model="gemini-2.5-flash",
-                contents=search_fallback_prompt,
-                config=types.GenerateContentConfig(thinking_config=types.ThinkingConfig(thinking_budget=0))
-            )
-            return fallback_response.text
+            yield _gemini_generate(search_fallback_prompt)
         except Exception as fallback_e:
-            return f"Error generating response: {e}. Please rephrase your question."
+            yield f"Error generating response: {e}. Please rephrase your question."
+    finally:
+        if reasoned is not None:
+            reasoned.cancel()
 
 # ---------- App Setup ----------
 st.set_page_config(page_title="News Pulse - Personalized News", page_icon="📰", layout="wide")
@@ -155,19 +335,60 @@ st.set_page_config(page_title="News Pulse - Personalized News", page_icon="📰"
 # Initialize DB
 db.init_db()
 
+# ---------- Background DB Writes ----------
+# Save/Send clicks hand their SQLite inserts to a single daemon thread so the rerun
+# isn't blocked on the write. One FIFO worker keeps writes in submission order.
+def _drain_writes(q: "queue.Queue"):
+    while True:
+        fn, args = q.get()
+        try:
+            result = fn(*args)
+            if isinstance(result, tuple) and result and result[0] is False:
+                logger.warning("Background write %s failed: %s", fn.__name__, result[1])
+        except Exception:
+            logger.exception("Background write %s failed", fn.__name__)
+        finally:
+            q.task_done()
+
+@st.cache_resource
+def _get_write_queue() -> "queue.Queue":
+    q = queue.Queue()
+    threading.Thread(target=_drain_writes, args=(q,), daemon=True, name="db-writer").start()
+    return q
+
+def enqueue_write(fn, *args):
+    _get_write_queue().put((fn, args))
+
 # ---------- Session Helpers ----------
+# argon2id tuned to ~100 ms per verify; existing bcrypt_sha256 hashes still verify and
+# are upgraded to argon2 on the user's next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt_sha256"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=19456,
+    argon2__parallelism=1,
+)
+
 def login(username: str, password: str) -> bool:
+    # Empty submits never touch the DB or the KDF
+    if not (username and password):
+        return False
     user = db.get_user_by_username(username)
     if not user:
         return False
-    return bcrypt_sha256.verify(password, user["password_hash"])
+    ok, new_hash = pwd_context.verify_and_update(password, user["password_hash"])
+    if ok and new_hash:
+        db.update_password_hash(user["id"], new_hash)
+    return ok
 
 def register(username: str, email: str, password: str) -> (bool, str):
     if not username or not email or not password:
         return False, "All fields are required."
     if len(password) < 6:
         return False, "Password must be at least 6 characters."
-    password_hash = bcrypt_sha256.hash(password)
+    password_hash = pwd_context.hash(password)
     ok, err = db.create_user(username, email, password_hash)
     if not ok:
         return False, err or "Registration failed."
@@ -257,49 +478,106 @@ def sidebar_menu():
     return choice
 
 # ---------- FIXED FUNCTION ----------
-def render_article_card(article: Dict[str, Any], user_id: int):
-    import hashlib
+def _article_text(article: Dict[str, Any]) -> str:
+    return article.get("title", "") + ". " + (article.get("description", "") or "")
+
+MIN_NER_CHARS = 40
+
+# (sentiment label, compound score, formatted entity strings)
+ArticleAnalysis = Tuple[str, float, List[str]]
+
+# Streamlit reruns the script on every widget interaction; cache the NLP results by
+# article text so unchanged pages don't re-run sentiment + NER. Entries are feed chunks
+# of up to FEED_CHUNK_SIZE articles, so 256 entries hold ~2k articles.
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def analyze_articles(texts: Tuple[str, ...]) -> List[ArticleAnalysis]:
+    # Headline-only texts yield next to no entities; don't spend a NER pass on them
+    ner_idx = [i for i, t in enumerate(texts) if len(t) >= MIN_NER_CHARS]
+    entities: List[List[str]] = [[] for _ in texts]
+    docs = get_nlp().pipe((texts[i] for i in ner_idx), batch_size=32)
+    for i, doc in zip(ner_idx, docs):
+        entities[i] = _unique_entities(doc)
+
+    return [(label, score, ents) for (label, score), ents in zip(analyze_sentiments(texts), entities)]
+
+def _unique_entities(doc) -> List[str]:
+    """Display strings like "Apple (ORG)", deduplicated case-insensitively per label and sorted."""
+    seen = set()
+    ents = []
+    for ent in doc.ents:
+        key = (ent.text.lower(), ent.label_)
+        if key not in seen:
+            seen.add(key)
+            ents.append(f"{ent.text} ({ent.label_})")
+    ents.sort()
+    return ents
+
+_SENT_EMOJI = {"positive": "😄", "neutral": "😐", "negative": "🙁"}
+
+@lru_cache(maxsize=4096)
+def _url_key(url: str) -> str:
+    # Short, stable widget-key suffix; crc32 is far cheaper than md5 and cached per URL
+    return format(zlib.crc32(url.encode()), "08x")
+
+def _safe_url(url: str) -> str:
+    """Only http(s) URLs go into a live href/src (feeds can carry javascript:/data: links)."""
+    return url if url.lower().startswith(("http://", "https://")) else ""
+
+def _card_html(article: Dict[str, Any], read_min: int, label: str, score: float,
+               entity_list: List[str], summary: Optional[str]) -> str:
+    """Static part of an article card as one HTML block (one element instead of a column tree)."""
+    esc = html.escape
+    url = _safe_url(article.get("url") or "")
+    image_url = _safe_url(article.get("image_url") or "")
+    if image_url:
+        image = f'<img src="{esc(image_url, quote=True)}" style="width:100%;border-radius:8px;">'
+    else:
+        image = '<div style="font-size:2.5rem;text-align:center;">🖼️</div>'
+    title = esc(article.get("title", "") or "")
+    if url:
+        title = f'<a href="{esc(url, quote=True)}" target="_blank" rel="noopener noreferrer">{title}</a>'
+    body = [
+        f'<h3 style="margin-top:0;">{title}</h3>',
+        f"<p><b>Source:</b> {esc(article.get('source', 'Unknown') or 'Unknown')} | "
+        f"<b>Published:</b> {esc(article.get('published_at', '') or '')} | <b>Read:</b> ~{read_min} min</p>",
+        f"<p>{esc(article.get('description', '') or '')}</p>",
+    ]
+    if summary:
+        body.append(f"<p><b>Summary:</b> {esc(summary)}</p>")
+    body.append(
+        f"<p><b>Sentiment:</b> {_SENT_EMOJI.get(label, '🙁')} <b>{esc(label.title())}</b> ({score:.2f})</p>"
+    )
+    if entity_list:
+        body.append(f"<p><b>Named Entities:</b> {esc(', '.join(entity_list))}</p>")
+    return (
+        '<div class="np-card" style="display:flex;gap:1rem;">'
+        f'<div style="flex:1;">{image}</div>'
+        f'<div style="flex:3;">{"".join(body)}</div>'
+        "</div>"
+    )
 
+def render_article_card(article: Dict[str, Any], user_id: int, index: int, analysis: ArticleAnalysis,
+                        summary: Optional[str] = None, read_min: Optional[int] = None):
     title = article.get("title", "")
     desc = article.get("description", "") or ""
-    combined_text = title + ". " + desc
-    label, score = analyze_sentiment(combined_text)
-    read_min = estimate_read_time(desc or title)
-
-    doc = nlp(combined_text)
-    entities = [(ent.text, ent.label_) for ent in doc.ents]
-    entity_list = [f"{text} ({label})" for text, label in sorted(entities, key=lambda x: x[0])]
+    label, score, entity_list = analysis
+    if read_min is None:
+        read_min = estimate_read_time(desc or title)
 
     # unique hash for widget keys
-    url_hash = hashlib.md5((article.get("url") or str(time.time())).encode()).hexdigest()[:8]
+    # (position + title when there's no URL, so keys stay stable across reruns)
+    url_hash = _url_key(article.get("url") or f"noidx-{index}-{article.get('title', '')}")
 
     with st.container(border=True):
-        cols = st.columns([1, 3])
-        if article.get("image_url"):
-            cols[0].image(article["image_url"], use_container_width=True)
-        else:
-            cols[0].markdown("🖼️")
-        cols[1].markdown(f"### [{title}]({article.get('url','')})")
-        meta = f"**Source:** {article.get('source','Unknown')} | **Published:** {article.get('published_at','')} | **Read:** ~{read_min} min"
-        cols[1].markdown(meta)
-        cols[1].markdown(desc)
-
-        sentiment_badge = f"**Sentiment:** :{'smile:' if label=='positive' else 'neutral_face:' if label=='neutral' else 'slightly_frowning_face:'} **{label.title()}** ({score:.2f})"
-        cols[1].markdown(sentiment_badge)
-
-        if entity_list:
-            cols[1].markdown(f"**Named Entities:** {', '.join(entity_list)}")
+        st.markdown(_card_html(article, read_min, label, score, entity_list, summary), unsafe_allow_html=True)
 
-        save_col, open_col = st.columns([1,1])
+        # Columns only where real widgets sit
+        save_col, open_col, chat_col = st.columns([1, 1, 1])
         if save_col.button("🔖 Save", key=f"save_{url_hash}"):
-            ok, err = db.save_article(user_id, article)
-            if ok:
-                st.toast("Saved to bookmarks!")
-            else:
-                st.warning(err or "Unable to save.")
+            enqueue_write(db.save_article, user_id, article)
+            st.toast("Saving to bookmarks...")
         open_col.link_button("Open Link", url=article.get("url",""), help="Open the full article")
 
-        chat_col = st.columns([1,1,1])[0]
         if chat_col.button("💬 Discuss", key=f"chatbtn_{url_hash}"):
             st.session_state.setdefault("open_chats", {})
             st.session_state["open_chats"][article.get("url")] = True
@@ -328,55 +606,137 @@ def render_article_card(article: Dict[str, Any], user_id: int):
                     msgs.append({"role":"user","content": user_q})
                     convo_map = st.session_state.setdefault('convo_map', {})
                     convo_key = f"convo_{url_hash}"
-                    convo_id = convo_map.get(convo_key)
                     try:
-                        if not convo_id:
-                            convo_id = db.create_conversation(user_id, article.get('url'))
-                            convo_map[convo_key] = convo_id
-                        db.save_message(convo_id, 'user', user_q)
-                    except Exception as e:
-                        st.warning(f"DB save (user message) failed: {e}")
-                    try:
-                        answer = ask_question(article, user_q)
+                        st.markdown(f"**You:** {user_q}")
+                        answer = st.write_stream(ask_question_stream(article, user_q))
                     except Exception as e:
                         answer = f"Error calling Gemini: {e}"
                     msgs.append({"role":"assistant","content": answer})
                     try:
-                        if convo_id:
-                            db.save_message(convo_id, 'assistant', answer)
+                        # Conversation (if new) + both messages in one transaction
+                        convo_map[convo_key] = db.record_turn(
+                            user_id, article.get('url'), convo_map.get(convo_key), user_q, answer
+                        )
                     except Exception as e:
-                        st.warning(f"DB save (assistant) failed: {e}")
+                        st.warning(f"DB save (chat) failed: {e}")
                     session_chats[article.get("url")] = msgs
                     st.rerun()
 
 # ---------- Pages ----------
+FEED_CHUNK_SIZE = 8
+
+def render_feed(articles: List[Dict[str, Any]], user_id: int, summaries: Optional[List[Optional[str]]] = None) -> List[ArticleAnalysis]:
+    """Render cards chunk by chunk into placeholders reserved up front.
+
+    The first cards paint after one small NLP batch instead of waiting for the whole page.
+    Returns the (label, score, entities) analysis of each article, in order.
+    """
+    placeholders = [st.empty() for _ in articles]
+    all_analyses = []
+    for start in range(0, len(articles), FEED_CHUNK_SIZE):
+        chunk = articles[start:start + FEED_CHUNK_SIZE]
+        analyses = analyze_articles(tuple(_article_text(a) for a in chunk))
+        read_mins = estimate_read_times([(a.get("description") or a.get("title", "")) for a in chunk])
+        for i, (art, analysis, read_min) in enumerate(zip(chunk, analyses, read_mins), start):
+            with placeholders[i].container():
+                render_article_card(art, user_id, i, analysis, summaries[i] if summaries and i < len(summaries) else None, read_min)
+        all_analyses.extend(analyses)
+    return all_analyses
+
+def _dedupe_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop repeated stories (by URL, or title+description when the URL is missing)."""
+    seen = set()
+    unique = []
+    for a in articles:
+        key = a.get("url") or hashlib.sha256(_article_text(a).encode()).digest()
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(a)
+    return unique
+
+BATCH_POLL_INTERVAL = 15.0
+MAX_BATCH_JOBS = 32
+
+# "Latest Picks" is the same for everyone, so its batch job is shared by every session,
+# keyed by the URL tuple. A worker thread submits and polls it; the script thread only
+# reads the entry and never waits on Gemini.
+@st.cache_resource
+def _latest_batches() -> Dict[str, Any]:
+    return {"lock": threading.Lock(), "jobs": {}}
+
+def _run_latest_batch(entry: Dict[str, Any], texts: List[str], client) -> None:
+    # On any failure the entry stays without summaries and is never resubmitted
+    try:
+        summaries = batch_summarize(texts, poll_interval=BATCH_POLL_INTERVAL, client=client)
+    except Exception:
+        logger.exception("Latest Picks batch summary failed")
+        return
+    if len(summaries) != len(texts):
+        # Results are matched to cards by position; a partial result can't be trusted
+        logger.warning("Latest Picks batch returned %d summaries for %d articles", len(summaries), len(texts))
+        return
+    entry["summaries"] = summaries
+
+def _latest_summaries(articles: List[Dict[str, Any]]) -> List[Optional[str]]:
+    """Pre-summarize "Latest Picks" via a background batch job; returns None until it's done."""
+    if not articles:
+        return []
+    key = tuple(a.get("url", "") for a in articles)
+    batches = _latest_batches()
+    with batches["lock"]:
+        entry = batches["jobs"].get(key)
+        if entry is None:
+            try:
+                client = get_gemini_client()
+            except Exception:
+                client = None
+            entry = {"summaries": None}
+            batches["jobs"][key] = entry
+            while len(batches["jobs"]) > MAX_BATCH_JOBS:
+                batches["jobs"].pop(next(iter(batches["jobs"])))
+            if client is not None:
+                threading.Thread(
+                    target=_run_latest_batch,
+                    args=(entry, [_article_text(a) for a in articles], client),
+                    daemon=True, name="gemini-batch",
+                ).start()
+    return entry["summaries"] or [None] * len(articles)
+
 def page_home():
     st.subheader("Top Headlines for You")
     prefs = db.get_preferences(st.session_state.user["id"]) if st.session_state.user else None
     preferred_categories = (prefs["categories"].split(",") if prefs and prefs["categories"] else []) or ["technology", "business", "science"]
+    categories = preferred_categories[:3]
+
+    # Fire the category and "Latest Picks" requests concurrently; page latency becomes
+    # the slowest request instead of the sum of all four.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        cats_future = ex.submit(top_headlines_multi, categories, max_results=5)
+        latest_future = ex.submit(top_headlines, max_results=10)
+    by_topic = cats_future.result()
+
     cols = st.columns(3)
-    for i, cat in enumerate(preferred_categories[:3]):
+    for i, cat in enumerate(categories):
         with cols[i]:
             st.markdown(f"#### {cat.title()}")
-            try:
-                headlines = top_headlines(topic=cat, max_results=5)
-                for art in headlines:
-                    st.markdown(f"- [{art['title']}]({art['url']})")
-            except Exception as e:
-                st.warning(str(e))
+            headlines = by_topic.get(cat, [])
+            if isinstance(headlines, Exception):
+                st.warning(str(headlines))
+                continue
+            for art in headlines:
+                st.markdown(f"- [{art['title']}]({art['url']})")
 
     st.divider()
     st.subheader("Latest Picks")
     try:
-        latest = top_headlines(max_results=10)
-        for art in latest:
-            render_article_card(art, st.session_state.user["id"])
+        latest = _dedupe_articles(latest_future.result())
+        render_feed(latest, st.session_state.user["id"], _latest_summaries(latest))
     except Exception as e:
         st.error(str(e))
 
 def page_search():
-    import plotly.express as px
-    from collections import Counter
+    import plotly.express as px  # heavy; only the Search page pays for it
 
     st.subheader("Search News")
     query = st.text_input("Search by topic, keyword, company, etc.", key="q")
@@ -387,7 +747,11 @@ def page_search():
     if st.button("Search", type="primary") and query.strip():
         db.add_search_history(st.session_state.user["id"], query)
         try:
-            results = search_news(query=query, lang=lang, country=country, max_results=limit)
+            # Load/warm the spaCy model on this thread while the search request is in flight
+            with ThreadPoolExecutor(max_workers=1) as ex:
+                search_future = ex.submit(search_news, query=query, lang=lang, country=country, max_results=limit)
+                get_nlp()
+            results = _dedupe_articles(search_future.result())
             if not results:
                 st.info("No results found. Try adjusting your query.")
                 return
@@ -396,16 +760,13 @@ def page_search():
             source_counts = Counter()
             sentiment_counts = Counter()
 
-            for art in results:
-                render_article_card(art, st.session_state.user["id"])
+            analyses = render_feed(results, st.session_state.user["id"])
+
+            for art, (label, _, _) in zip(results, analyses):
                 # Count sources
                 source = art.get("source", "Unknown") or "Unknown"
                 source_counts[source] += 1
-                # Sentiment
-                title = art.get("title", "")
-                desc = art.get("description", "") or ""
-                combined = title + ". " + desc
-                label, _ = analyze_sentiment(combined)
+                # Sentiment (already computed for the cards)
                 sentiment_counts[label] += 1
 
             # --- Divider before visualization ---
@@ -449,6 +810,9 @@ def page_bookmarks():
         st.info("No bookmarks yet. Save articles to see them here.")
         return
 
+    # Build the export once per page, not once per bookmark row
+    csv_blob = _bookmarks_csv_for(tuple(r["id"] for r in saved), saved)
+
     for art in saved:
         with st.container(border=True):
             st.markdown(f"### [{art['title']}]({art['url']})")
@@ -462,19 +826,23 @@ def page_bookmarks():
                 st.rerun()
             cols[1].download_button(
                 label="Export as CSV",
-                data=_bookmarks_to_csv(saved),
+                data=csv_blob,
                 file_name="bookmarks.csv",
                 key=f"export_{art['id']}"  # Unique key per article
             )
 
+# Saved rows are never edited in place, so their ids identify the export; this keeps
+# reruns (e.g. every "Remove" click) from re-serializing the whole list.
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _bookmarks_csv_for(ids: Tuple[int, ...], _rows: List[Dict[str, Any]]) -> str:
+    return _bookmarks_to_csv(_rows)
+
+BOOKMARK_CSV_FIELDS = ["title", "url", "description", "source", "published_at", "image_url"]
+
 def _bookmarks_to_csv(rows: List[Dict[str, Any]]) -> str:
-    import csv, io
-    buff = io.StringIO()
-    writer = csv.DictWriter(buff, fieldnames=["title","url","description","source","published_at","image_url"])
-    writer.writeheader()
-    for r in rows:
-        writer.writerow({k: r.get(k, "") for k in writer.fieldnames})
-    return buff.getvalue()
+    import pandas as pd
+    # pandas serializes in C instead of a per-row DictWriter loop
+    return pd.DataFrame(rows, columns=BOOKMARK_CSV_FIELDS).fillna("").to_csv(index=False)
 
 def page_profile():
     st.subheader("Profile")
@@ -496,7 +864,7 @@ def page_profile():
 def page_prefs():
     st.subheader("Preferences")
     prefs = db.get_preferences(st.session_state.user["id"])
-    cur_cats = [c for c in (prefs["categories"].split(",") if prefs["categories"] else []) if c]
+    cur_cats = [c for c in (prefs["categories"].split(",") if prefs["categories"] else []) if is_category(c)]
     cur_srcs = [s for s in (prefs["sources"].split(",") if prefs["sources"] else []) if s]
     cur_keys = [k for k in (prefs["keywords"].split(",") if prefs["keywords"] else []) if k]
 
@@ -1,13 +1,37 @@
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Optional, Tuple, Dict, Any
 
 DB_PATH = Path(__file__).parent / "app.db"
 
+# INSERT ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.RLock()
+
+def _shared_connection() -> sqlite3.Connection:
+    # One connection per process instead of a connect/journal setup on every query.
+    # WAL lets readers proceed while a write is committing.
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(
+            "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+        )
+        _conn = conn
+    return _conn
+
+@contextmanager
 def get_connection():
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Yield the shared connection, serialized across threads; commits or rolls back on exit."""
+    with _lock:
+        conn = _shared_connection()
+        with conn:
+            yield conn
 
 def init_db():
     schema_file = Path(__file__).parent / "schema.sql"
@@ -49,6 +73,11 @@ def update_profile(user_id: int, full_name: str, bio: str) -> None:
         )
         conn.commit()
 
+def update_password_hash(user_id: int, password_hash: str) -> None:
+    with get_connection() as conn:
+        conn.execute("UPDATE users SET password_hash = ? WHERE id = ?", (password_hash, user_id))
+        conn.commit()
+
 # ---------- PREFERENCES ----------
 
 def get_preferences(user_id: int) -> sqlite3.Row:
@@ -56,8 +85,18 @@ def get_preferences(user_id: int) -> sqlite3.Row:
         cur = conn.execute("SELECT * FROM preferences WHERE user_id = ?", (user_id,))
         row = cur.fetchone()
         if not row:
-            conn.execute("INSERT INTO preferences (user_id) VALUES (?)", (user_id,))
-            conn.commit()
+            # First visit: create the default row and read it back in the same statement
+            if _HAS_RETURNING:
+                rows = conn.execute(
+                    "INSERT INTO preferences (user_id) VALUES (?) ON CONFLICT(user_id) DO NOTHING RETURNING *",
+                    (user_id,),
+                ).fetchall()
+                conn.commit()
+                if rows:
+                    return rows[0]
+            else:
+                conn.execute("INSERT OR IGNORE INTO preferences (user_id) VALUES (?)", (user_id,))
+                conn.commit()
             cur = conn.execute("SELECT * FROM preferences WHERE user_id = ?", (user_id,))
             row = cur.fetchone()
         return row
@@ -148,3 +187,16 @@ def get_messages_for_article(article_url: str) -> list:
             ORDER BY m.id ASC
         """, (article_url,))
         return [dict(row) for row in cur.fetchall()]
+
+def record_turn(user_id: int, article_url: str, conversation_id: Optional[int], user_msg: str, assistant_msg: str) -> int:
+    """Save one question/answer pair (creating the conversation if needed) in a single commit."""
+    with get_connection() as conn:
+        if not conversation_id:
+            cur = conn.execute("INSERT INTO conversations (user_id, article_url) VALUES (?, ?)", (user_id, article_url))
+            conversation_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO messages (conversation_id, role, content) VALUES (?, ?, ?)",
+            [(conversation_id, "user", user_msg), (conversation_id, "assistant", assistant_msg)],
+        )
+        conn.commit()
+        return conversation_id
@@ -1,4 +1,8 @@
+import asyncio
+import hashlib
 import os
+from pathlib import Path
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Try to import google generative ai; if missing, functions will raise helpful error.
@@ -31,6 +35,62 @@ if genai and API_KEY:
     except Exception:
         pass  # Ignore configure differences
 
+# Constructing the model/client does auth + object setup; build each once and reuse it
+# (lru_cache is thread-safe, and keeps the client's HTTP connection warm between calls).
+@lru_cache(maxsize=1)
+def _client():
+    return new_genai.Client(api_key=API_KEY)
+
+@lru_cache(maxsize=1)
+def _legacy_model():
+    legacy_genai.configure(api_key=API_KEY)
+    return legacy_genai.GenerativeModel(MODEL)
+
+# The installed SDK doesn't change at runtime: pick the generate call once here instead of
+# trying each SDK shape (and paying for its exception) on every request.
+def _generate_new(prompt, config=None):
+    return _client().models.generate_content(model=MODEL, contents=prompt, config=config)
+
+def _generate_legacy(prompt, config=None):
+    return _legacy_model().generate_content(prompt, generation_config=config)
+
+def _stream_new(prompt, config=None):
+    for chunk in _client().models.generate_content_stream(model=MODEL, contents=prompt, config=config):
+        yield chunk.text or ""
+
+def _stream_legacy(prompt, config=None):
+    for chunk in _legacy_model().generate_content(prompt, generation_config=config, stream=True):
+        yield chunk.text or ""
+
+_generate = _generate_new if new_genai else _generate_legacy if legacy_genai else None
+_stream = _stream_new if new_genai else _stream_legacy if legacy_genai else None
+
+# Persistent cache of generated text so a repeat summary/question for the same article
+# is a small disk read instead of an LLM call. Optional: without diskcache, no caching.
+try:
+    import diskcache
+except Exception:
+    diskcache = None
+
+CACHE_DIR = Path(__file__).parent / ".cache" / "gemini"
+CACHE_TTL = 7 * 86400
+_disk_cache = diskcache.Cache(str(CACHE_DIR)) if diskcache else None
+
+def _cache_key(prefix, *parts):
+    """Hash the full prompt and generation config (not just the input text) into the key,
+    so a prompt or config change never serves results generated under the old one."""
+    digest = hashlib.blake2b("|".join(str(p) for p in parts).encode(), digest_size=16).hexdigest()
+    return f"{prefix}:{digest}"
+
+def _cache_get(key):
+    return _disk_cache.get(key) if _disk_cache is not None else None
+
+def _remember(key, value):
+    """Store a successful result (error strings are returned directly, never cached)."""
+    if _disk_cache is not None and value:
+        _disk_cache.set(key, value, expire=CACHE_TTL)
+    return value
+
 def _extract_text_from_response(resp):
     """Attempt to extract generated text from several possible response shapes."""
     if not resp:
@@ -56,6 +116,22 @@ def _extract_text_from_response(resp):
         pass
     return str(resp)
 
+def _clip(text, head=8000, tail=2000):
+    """Bound prompt size (latency and cost grow with input tokens): keep the head and tail."""
+    if len(text) <= head + tail:
+        return text
+    return text[:head] + "\n…\n" + text[-tail:]
+
+SUMMARY_TEMPERATURE = 0.3
+
+def _summary_prompt(text):
+    return f"Summarize the following news article in a concise paragraph:\n\n{_clip(text)}"
+
+def _summary_config(max_tokens):
+    """Cap the decoder itself (the model doesn't reliably obey a length ask in the prompt,
+    and latency grows with every output token). Both SDKs accept the plain dict."""
+    return {"max_output_tokens": max_tokens, "temperature": SUMMARY_TEMPERATURE}
+
 def summarize_text(text, max_tokens=300):
     """Summarize given text using Gemini. Returns a string summary or an error message."""
     if not text or not text.strip():
@@ -65,21 +141,86 @@ def summarize_text(text, max_tokens=300):
     if not API_KEY:
         return "Missing GEMINI_API_KEY environment variable."
 
-    prompt = f"Summarize the following news article in a concise paragraph (max {max_tokens} tokens):\n\n{text}"
+    prompt, config = _summary_prompt(text), _summary_config(max_tokens)
+    key = _cache_key("sum", MODEL, prompt, config)
+    cached = _cache_get(key)
+    if cached:
+        return cached
+
     try:
+        resp = _generate(prompt, config)
+        return _remember(key, _extract_text_from_response(resp))
+    except Exception as e:
+        return f"Error during summarization: {str(e)}"
+
+def summarize_text_stream(text, max_tokens=300):
+    """Yield the summary as it is generated (e.g. for st.write_stream), so the first words
+    show up after time-to-first-token rather than after the whole response."""
+    if not text or not text.strip():
+        return
+    if genai is None:
+        yield "Gemini client (google.generativeai) not installed. Install with: pip install google-generativeai"
+        return
+    if not API_KEY:
+        yield "Missing GEMINI_API_KEY environment variable."
+        return
+
+    prompt, config = _summary_prompt(text), _summary_config(max_tokens)
+    key = _cache_key("sum", MODEL, prompt, config)
+    cached = _cache_get(key)
+    if cached:
+        yield cached
+        return
+
+    parts = []
+    try:
+        for piece in _stream(prompt, config):
+            parts.append(piece)
+            yield piece
+    except Exception as e:
+        yield f"Error during summarization: {str(e)}"
+        return
+    _remember(key, "".join(parts))
+
+async def _summarize_one(sem, client, text, max_tokens):
+    if not text or not text.strip():
+        return ""
+    prompt, config = _summary_prompt(text), _summary_config(max_tokens)
+    key = _cache_key("sum", MODEL, prompt, config)
+    cached = _cache_get(key)
+    if cached:
+        return cached
+    async with sem:
         try:
-            model = genai.GenerativeModel(MODEL)
-            resp = model.generate_content(prompt)
-            return _extract_text_from_response(resp)
-        except Exception:
-            pass
-        try:
-            resp = genai.generate_content(model=MODEL, contents=prompt)
-            return _extract_text_from_response(resp)
+            if client is not None:
+                resp = await client.aio.models.generate_content(model=MODEL, contents=prompt, config=config)
+                return _remember(key, _extract_text_from_response(resp))
+            # Legacy SDK has no async client; run the sync call on a worker thread
+            return await asyncio.to_thread(summarize_text, text, max_tokens)
         except Exception as e:
             return f"Error during summarization: {str(e)}"
-    except Exception as e:
-        return f"Error during summarization: {str(e)}"
+
+async def summarize_many_async(texts, max_tokens=300, concurrency=8):
+    """Summarize texts concurrently (at most `concurrency` Gemini calls in flight)."""
+    # A client per batch (not the shared _client()): its async HTTP pool is bound to the
+    # running event loop, and asyncio.run() creates a fresh loop each time. Close it before
+    # that loop goes away so no connections are left bound to a dead loop.
+    client = new_genai.Client(api_key=API_KEY) if new_genai else None
+    sem = asyncio.Semaphore(concurrency)
+    try:
+        return await asyncio.gather(*[_summarize_one(sem, client, t, max_tokens) for t in texts])
+    finally:
+        if client is not None:
+            await client.aio.aclose()
+
+def summarize_many(texts, max_tokens=300, concurrency=8):
+    """Blocking wrapper around summarize_many_async for Streamlit. Returns one string per text."""
+    texts = list(texts)
+    if genai is None:
+        return ["Gemini client (google.generativeai) not installed. Install with: pip install google-generativeai"] * len(texts)
+    if not API_KEY:
+        return ["Missing GEMINI_API_KEY environment variable."] * len(texts)
+    return asyncio.run(summarize_many_async(texts, max_tokens, concurrency))
 
 def generate_questions(text, num_questions=5):
     """Generate study/discussion questions from text using Gemini."""
@@ -91,18 +232,13 @@ def generate_questions(text, num_questions=5):
         return "Missing GEMINI_API_KEY environment variable."
 
     prompt = f"Generate {num_questions} clear, concise, thought-provoking study questions based on the following article:\n\n{text}\n\nReturn each question on a separate line."
+    key = _cache_key("qs", MODEL, prompt)
+    cached = _cache_get(key)
+    if cached:
+        return cached
+
     try:
-        try:
-            model = genai.GenerativeModel(MODEL)
-            resp = model.generate_content(prompt)
-            return _extract_text_from_response(resp)
-        except Exception:
-            pass
-        try:
-            resp = genai.generate_content(model=MODEL, contents=prompt)
-            return _extract_text_from_response(resp)
-        except Exception as e:
-            return f"Error during question generation: {str(e)}"
+        return _remember(key, _extract_text_from_response(_generate(prompt)))
     except Exception as e:
         return f"Error during question generation: {str(e)}"
 
@@ -117,34 +253,18 @@ def ask_question(article_text: str, question: str, max_output_tokens: int = 400)
 Answer the user's question succinctly and clearly. If you do not know, say you don't know.
 
 Article:
-{article_text}
+{_clip(article_text)}
 
 User question:
 {question}
 
 Answer:"""
+    key = _cache_key("ask", MODEL, prompt)
+    cached = _cache_get(key)
+    if cached:
+        return cached
 
-    # Try new SDK usage first
-    try:
-        if new_genai:
-            client = new_genai.Client(api_key=API_KEY)
-            resp = client.models.generate_content(model=MODEL, contents=prompt)
-            try:
-                client.close()
-            except Exception:
-                pass
-            return _extract_text_from_response(resp).strip()
-    except Exception:
-        pass
-
-    # Try legacy SDK
     try:
-        if legacy_genai:
-            legacy_genai.configure(api_key=API_KEY)
-            model_obj = legacy_genai.GenerativeModel(MODEL)
-            resp = model_obj.generate_content(prompt)
-            return _extract_text_from_response(resp).strip()
+        return _remember(key, _extract_text_from_response(_generate(prompt)).strip())
     except Exception as e:
         return f"Gemini call failed: {e}"
-
-    return "Gemini call failed: unsupported SDK or configuration."
@@ -1,9 +1,20 @@
 import os
 import requests
-from typing import List, Optional, Dict, Any
-from urllib.parse import urlencode
+from cachetools import TTLCache
+from threading import Lock
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Union
 from dotenv import load_dotenv
 
+# orjson parses the GNews payloads several times faster than the stdlib; fall back to
+# json when it isn't installed.
+try:
+    import orjson as _json
+except Exception:
+    import json as _json
+
 load_dotenv()
 API_KEY = os.getenv("GNEWS_API_KEY")
 DEFAULT_LANGUAGE = os.getenv("DEFAULT_LANGUAGE", "en")
@@ -11,15 +22,44 @@ DEFAULT_COUNTRY = os.getenv("DEFAULT_COUNTRY", "in")
 
 BASE_URL = "https://gnews.io/api/v4"
 
+# One keep-alive session per process: repeat calls reuse the pooled TLS connection to
+# gnews.io, and transient 5xx failures are retried with backoff. 429 (quota) isn't retried,
+# since retries spend more quota, and Retry-After is ignored so a server-suggested sleep
+# can't block the caller past the backoff.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False,
+        raise_on_status=False,  # hand the last response to _request so its error body is shown
+    ),
+))
+
+# Identical requests within a couple of minutes (page refreshes, reruns) are served from
+# memory instead of another round-trip against the GNews quota. Errors aren't cached.
+_cache: TTLCache = TTLCache(maxsize=512, ttl=120)
+_cache_lock = Lock()
+
 def _request(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
     if not API_KEY:
         raise RuntimeError("Missing GNEWS_API_KEY. Create a .env file from .env.example and add your key.")
+    key = (endpoint, tuple(sorted(params.items())))
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        return cached
     params["apikey"] = API_KEY
-    url = f"{BASE_URL}/{endpoint}?{urlencode(params)}"
     try:
-        resp = requests.get(url, timeout=15)
+        resp = _session.get(f"{BASE_URL}/{endpoint}", params=params, timeout=15)
         resp.raise_for_status()
-        return resp.json()
+        data = _json.loads(resp.content)
+        with _cache_lock:
+            _cache[key] = data
+        return data
     except requests.HTTPError as e:
         raise RuntimeError(f"GNews API error: {e} -> {resp.text}")  # type: ignore
     except Exception as e:
@@ -47,16 +87,46 @@ def top_headlines(topic: Optional[str] = None, lang: Optional[str] = None, count
     data = _request("top-headlines", params)
     return _normalize_articles(data.get("articles", []))
 
+def top_headlines_multi(topics: List[str], lang: Optional[str] = None, country: Optional[str] = None, max_results: int = 20) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+    """Fetch headlines for several topics concurrently.
+
+    Returns {topic: articles}; a topic whose request failed maps to the raised exception
+    instead, so one bad topic doesn't hide the others.
+    """
+    return _fan_out(lambda t: top_headlines(topic=t, lang=lang, country=country, max_results=max_results), topics)
+
+def search_news_many(queries: List[str], lang: Optional[str] = None, country: Optional[str] = None, max_results: int = 20) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+    """Run several searches concurrently; same {query: articles | exception} shape as top_headlines_multi."""
+    return _fan_out(lambda q: search_news(q, lang=lang, country=country, max_results=max_results), queries)
+
+MAX_CONCURRENT_REQUESTS = 8
+
+def _fan_out(fetch, keys: List[str]) -> Dict[str, Union[List[Dict[str, Any]], Exception]]:
+    # Network-bound: N requests overlap, so total latency is ~one round-trip, not N.
+    if not keys:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(keys), MAX_CONCURRENT_REQUESTS)) as ex:
+        futures = {k: ex.submit(fetch, k) for k in keys}
+    results: Dict[str, Union[List[Dict[str, Any]], Exception]] = {}
+    for k, fut in futures.items():
+        try:
+            results[k] = fut.result()
+        except Exception as e:
+            results[k] = e
+    return results
+
+_EMPTY: Dict[str, Any] = {}
+
 def _normalize_articles(articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    normalized = []
-    for a in articles:
-        normalized.append({
+    return [
+        {
             "title": a.get("title", ""),
             "description": a.get("description", ""),
             "content": a.get("content", ""),
             "url": a.get("url", ""),
             "image_url": a.get("image", ""),
             "published_at": a.get("publishedAt", ""),
-            "source": (a.get("source") or {}).get("name", ""),
-        })
-    return normalized
+            "source": (a.get("source") or _EMPTY).get("name", ""),
+        }
+        for a in articles
+    ]
@@ -57,3 +57,10 @@ CREATE TABLE IF NOT EXISTS messages (
     created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY(conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
 );
+
+-- Indexes for the lookups in db.py. users.username and saved_articles(user_id, url)
+-- are already covered by their UNIQUE constraints.
+CREATE INDEX IF NOT EXISTS idx_saved_user_id ON saved_articles(user_id, id);
+CREATE INDEX IF NOT EXISTS idx_history_user_id ON search_history(user_id, id);
+CREATE INDEX IF NOT EXISTS idx_conv_article_url ON conversations(article_url);
+CREATE INDEX IF NOT EXISTS idx_messages_conv ON messages(conversation_id, id);
@@ -1,21 +1,60 @@
+import logging
+import re
 from functools import lru_cache
-from typing import Tuple
+from typing import Iterable, List, Optional, Tuple
 import nltk
 from nltk.sentiment import SentimentIntensityAnalyzer
 
-# Ensure lexicon (cached so it doesn't re-download every run)
+logger = logging.getLogger(__name__)
+
+# Ensure lexicon and build the analyzer once, on first use rather than at import: if the
+# lexicon can't be fetched (offline, blocked proxy) sentiment degrades to neutral instead
+# of taking the whole app down with it.
 @lru_cache(maxsize=1)
-def _get_analyzer():
+def _analyzer() -> Optional[SentimentIntensityAnalyzer]:
     try:
-        nltk.data.find("sentiment/vader_lexicon.zip")
-    except LookupError:
-        nltk.download("vader_lexicon")
-    return SentimentIntensityAnalyzer()
+        try:
+            nltk.data.find("sentiment/vader_lexicon.zip")
+        except LookupError:
+            nltk.download("vader_lexicon", quiet=True)
+        return SentimentIntensityAnalyzer()
+    except Exception:
+        logger.exception("VADER lexicon unavailable; sentiment scores default to neutral")
+        return None
+
+# URLs, e-mail addresses and leftover HTML tags score neutral in VADER but still cost
+# tokenization; drop them before scoring. This can shift scores slightly versus raw
+# VADER, since URL fragments occasionally contain lexicon words.
+# Tags must look like tags (a letter after "<"), so prose such as "Sensex < 60,000 while
+# Nifty > 18,000" keeps its text.
+_NOISE = re.compile(r"https?://\S+|www\.\S+|</?[A-Za-z][^>]*>|\S+@\S+")
+
+def _clean(text: str) -> str:
+    return _NOISE.sub(" ", text).strip() if text else ""
+
+def _label(score: float) -> str:
+    return "positive" if score >= 0.05 else "negative" if score <= -0.05 else "neutral"
 
 def analyze_sentiment(text: str) -> Tuple[str, float]:
-    if not text or not text.strip():
+    text = _clean(text)
+    sia = _analyzer()
+    if not text or sia is None:
         return "neutral", 0.0
-    sia = _get_analyzer()
     score = sia.polarity_scores(text)["compound"]
-    label = "positive" if score >= 0.05 else "negative" if score <= -0.05 else "neutral"
-    return label, float(score)
+    return _label(score), float(score)
+
+def analyze_sentiments(texts: Iterable[str]) -> List[Tuple[str, float]]:
+    """Score a feed in one pass with a single analyzer lookup; empty texts short-circuit."""
+    sia = _analyzer()
+    if sia is None:
+        return [("neutral", 0.0) for _ in texts]
+    polarity_scores = sia.polarity_scores
+    results = []
+    for text in texts:
+        text = _clean(text)
+        if not text:
+            results.append(("neutral", 0.0))
+            continue
+        score = polarity_scores(text)["compound"]
+        results.append((_label(score), float(score)))
+    return results
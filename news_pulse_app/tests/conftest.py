@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The app imports its modules flat (e.g. `from sentiment import ...`)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,16 @@
+import pytest
+
+pytest.importorskip("nltk")
+
+from sentiment import _clean
+
+
+def test_clean_keeps_prose_with_angle_brackets():
+    text = "Sensex < 60,000 while Nifty > 18,000 gains"
+    assert _clean(text) == text
+
+
+def test_clean_strips_tags_urls_and_emails():
+    cleaned = _clean("<p>Markets <b>rally</b></p> https://example.com/x mail desk@example.com")
+    assert "<" not in cleaned and "http" not in cleaned and "@" not in cleaned
+    assert "Markets" in cleaned and "rally" in cleaned
@@ -1,9 +1,29 @@
 import re
 from typing import List
 
+_WORD_RE = re.compile(r"\w+")
+
+def _word_count(text: str) -> int:
+    if not text:
+        return 0
+    # ASCII news text: a C-level whitespace split gives essentially the same count as the
+    # regex at a fraction of the cost. Other scripts (hi, te, ta, ...) keep the regex.
+    if text.isascii():
+        return len(text.split())
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
 def estimate_read_time(text: str) -> int:
     # Rough estimate: 200 words per minute
-    words = re.findall(r"\w+", text or "")
-    return max(1, int(len(words) / 200) + (1 if len(words) % 200 else 0))
+    return max(1, -(-_word_count(text) // 200))
+
+def estimate_read_times(texts: List[str]) -> List[int]:
+    """Batch form of estimate_read_time: one pass over the texts, ceil-divide vectorized."""
+    import numpy as np
+    counts = np.fromiter((_word_count(t) for t in texts), dtype=np.int64, count=len(texts))
+    return np.maximum(1, -(-counts // 200)).tolist()
+
+CATEGORIES = ("world", "nation", "business", "technology", "entertainment", "sports", "science", "health")
+_CATEGORIES_SET = frozenset(CATEGORIES)
 
-CATEGORIES = ["world", "nation", "business", "technology", "entertainment", "sports", "science", "health"]
+def is_category(name: str) -> bool:
+    return name in _CATEGORIES_SET